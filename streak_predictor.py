@@ -12,7 +12,7 @@ This system is designed to be unpenetratable because it only bets when ALL signa
 
 import streamlit as st
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
+from typing import Optional, List
 
 # ============================================================================
 # PAGE CONFIG
@@ -154,8 +154,25 @@ st.markdown("""
 # ============================================================================
 # DATA MODELS
 # ============================================================================
+# Venue each streak icon is restricted to (plain streaks apply to both)
+ICON_VENUES = {"🏠": "home", "✈️": "away"}
+
+# (checkbox label, TeamStreaks attribute, expander title) for each streak type
+STREAK_CATEGORIES = (
+    ("Scoring", "scoring", "📊 Scoring Streaks"),
+    ("BTTS", "btts", "⚡ BTTS Streaks"),
+    ("No BTTS", "no_btts", "🚫 No BTTS Streaks"),
+    ("Over 0.5", "over05", "📈 Over 0.5 Goals Streaks"),
+    ("Over 2.5", "over25", "📈 Over 2.5 Goals Streaks"),
+    ("Unbeaten", "unbeaten", "🛡️ Unbeaten Streaks"),
+    ("Without Win", "without_win", "📉 Without Win Streaks"),
+)
+
+
 @dataclass
 class Streak:
+    __slots__ = ("streak_type", "icon")
+    
     streak_type: str
     icon: str  # "", "🏠", "✈️"
     
@@ -167,11 +184,7 @@ class Streak:
     def venue_matches(self, team_venue: str) -> bool:
         if not self.icon:
             return True
-        if self.icon == "🏠":
-            return team_venue == "home"
-        if self.icon == "✈️":
-            return team_venue == "away"
-        return False
+        return ICON_VENUES.get(self.icon) == team_venue
 
 
 @dataclass
@@ -191,8 +204,9 @@ class TeamStreaks:
         return "home" if self.is_home else "away"
     
     def has_streak_matching_venue(self, streak_list: List[Streak], icon_filter: str = None) -> bool:
+        venue = self.venue
         for s in streak_list:
-            if s.venue_matches(self.venue):
+            if s.venue_matches(venue):
                 if icon_filter is None or s.icon == icon_filter:
                     return True
         return False
@@ -274,40 +288,52 @@ def predict_match(home: TeamStreaks, away: TeamStreaks) -> PredictionResult:
     # STEP 1: Identify All Signals
     # ========================================================================
     
+    # Each streak check scans the team's streak lists, so evaluate once
+    home_scoring = home.has_any_scoring()
+    home_over05 = home.has_over05_home()
+    home_no_btts = home.has_no_btts_home()
+    away_scoring = away.has_any_scoring()
+    away_btts = away.has_btts_away()
+    away_without_win = away.has_without_win_away()
+    away_unbeaten = away.has_unbeaten_away()
+    away_over05 = away.has_over05_away()
+    away_no_btts = away.has_no_btts_away()
+    away_over05_only = away_over05 and not away_unbeaten and not away_without_win and not away_btts
+    
     # Signals that suggest BTTS YES
     btts_yes_signals = []
     
     # Signal 1: Away has BTTS ✈️
-    if away.has_btts_away():
+    if away_btts:
         btts_yes_signals.append(f"{away.name} has BTTS ✈️")
     
     # Signal 2: Both teams have scoring streaks
-    if home.has_any_scoring() and away.has_any_scoring():
+    if home_scoring and away_scoring:
         btts_yes_signals.append(f"Both teams have scoring streaks")
     
     # Signal 3: Away has Over 0.5 ✈️ + Unbeaten ✈️
-    if away.has_over05_away() and away.has_unbeaten_away():
+    if away_over05 and away_unbeaten:
         btts_yes_signals.append(f"{away.name} has Over 0.5 ✈️ + Unbeaten ✈️")
     
     # Signals that suggest BTTS NO
     btts_no_signals = []
     
     # Signal 1: Any team has No BTTS matching venue
-    if home.has_no_btts_home():
+    if home_no_btts:
         btts_no_signals.append(f"{home.name} has No BTTS 🏠")
-    if away.has_no_btts_away():
+    if away_no_btts:
         btts_no_signals.append(f"{away.name} has No BTTS ✈️")
     
     # Signal 2: Away has Without Win ✈️
-    if away.has_without_win_away():
+    if away_without_win:
         btts_no_signals.append(f"{away.name} has Without Win ✈️")
     
     # Signal 3: Away has Unbeaten ✈️ only (no Over 0.5 ✈️) AND home has no scoring
-    if away.has_unbeaten_away() and not away.has_over05_away() and not home.has_any_scoring():
+    if away_unbeaten and not away_over05 and not home_scoring:
         btts_no_signals.append(f"{away.name} has Unbeaten ✈️ only (home no scoring)")
     
     # Signal 4: Away has Over 0.5 ✈️ only (no other streaks)
-    if away.has_over05_away() and not away.has_unbeaten_away() and not away.has_without_win_away() and not away.has_btts_away():
+    if away_over05_only:
         btts_no_signals.append(f"{away.name} has Over 0.5 ✈️ only")
     
     # Signals for Winner
@@ -316,28 +342,28 @@ def predict_match(home: TeamStreaks, away: TeamStreaks) -> PredictionResult:
     draw_signals = []
     
     # Home win signals
-    if away.has_without_win_away():
+    if away_without_win:
         home_win_signals.append(f"{away.name} has Without Win ✈️ → cannot win")
     
     # Away win signals
-    if away.has_unbeaten_away() and not away.has_over05_away() and not home.has_any_scoring():
+    if away_unbeaten and not away_over05 and not home_scoring:
         away_win_signals.append(f"{away.name} has Unbeaten ✈️ only + home no scoring")
     
     # Away/Draw signals
-    if away.has_unbeaten_away() and away.has_over05_away():
+    if away_unbeaten and away_over05:
         draw_signals.append(f"{away.name} has Unbeaten ✈️ + Over 0.5 ✈️ → avoids defeat")
     
-    if away.has_btts_away():
+    if away_btts:
         draw_signals.append(f"{away.name} has BTTS ✈️ → winner uncertain")
     
     # Signals for Over/Under
     under_signals = []
     
     # Under signals
-    if away.has_over05_away() and not away.has_unbeaten_away() and not away.has_without_win_away() and not away.has_btts_away():
+    if away_over05_only:
         under_signals.append(f"{away.name} has Over 0.5 ✈️ only → Under 2.5 likely")
     
-    if away.has_without_win_away():
+    if away_without_win:
         under_signals.append(f"{away.name} has Without Win ✈️ → Under 2.5 likely")
     
     # ========================================================================
@@ -349,15 +375,15 @@ def predict_match(home: TeamStreaks, away: TeamStreaks) -> PredictionResult:
         contradictions.append(f"CONTRADICTION: BTTS YES signals ({', '.join(btts_yes_signals)}) vs BTTS NO signals ({', '.join(btts_no_signals)})")
     
     # Contradiction 2: Without Win ✈️ (away cannot win) vs Unbeaten ✈️ (away cannot lose)
-    if away.has_without_win_away() and away.has_unbeaten_away():
+    if away_without_win and away_unbeaten:
         contradictions.append(f"CONTRADICTION: {away.name} has both Without Win ✈️ (cannot win) and Unbeaten ✈️ (cannot lose) → impossible")
     
     # Contradiction 3: Without Win ✈️ vs BTTS ✈️
-    if away.has_without_win_away() and away.has_btts_away():
+    if away_without_win and away_btts:
         contradictions.append(f"CONTRADICTION: {away.name} has Without Win ✈️ (BTTS NO) and BTTS ✈️ (BTTS YES)")
     
     # Contradiction 4: Unbeaten ✈️ only (away win) vs home scoring
-    if away.has_unbeaten_away() and not away.has_over05_away() and home.has_any_scoring():
+    if away_unbeaten and not away_over05 and home_scoring:
         contradictions.append(f"CONTRADICTION: {away.name} has Unbeaten ✈️ only (Away Win) but {home.name} has scoring streak → Home will score")
     
     # ========================================================================
@@ -419,8 +445,8 @@ def predict_match(home: TeamStreaks, away: TeamStreaks) -> PredictionResult:
     
     # Score Prediction (only for Pattern A style)
     score_prediction = None
-    if away.has_without_win_away():
-        if home.has_over05_home():
+    if away_without_win:
+        if home_over05:
             score_prediction = "1-0"
             reasoning.append(f"\n🎯 **Score Prediction:** {score_prediction} ({home.name} has Over 0.5 🏠)")
         else:
@@ -429,15 +455,15 @@ def predict_match(home: TeamStreaks, away: TeamStreaks) -> PredictionResult:
     
     # Determine pattern name
     pattern_name = "Contradiction-Based Prediction"
-    if away.has_btts_away():
+    if away_btts:
         pattern_name = "Pattern: BTTS ✈️"
-    elif away.has_without_win_away():
+    elif away_without_win:
         pattern_name = "Pattern: Without Win ✈️"
-    elif away.has_unbeaten_away() and away.has_over05_away():
+    elif away_unbeaten and away_over05:
         pattern_name = "Pattern: Unbeaten ✈️ + Over 0.5 ✈️"
-    elif away.has_unbeaten_away() and not away.has_over05_away():
+    elif away_unbeaten and not away_over05:
         pattern_name = "Pattern: Unbeaten ✈️ only"
-    elif away.has_over05_away() and not away.has_unbeaten_away() and not away.has_without_win_away():
+    elif away_over05 and not away_unbeaten and not away_without_win:
         pattern_name = "Pattern: Over 0.5 ✈️ only"
     
     return PredictionResult(
@@ -486,68 +512,15 @@ def build_team_from_checkboxes(prefix: str, name: str, is_home: bool) -> TeamStr
     """Build TeamStreaks object from checkbox selections"""
     team = TeamStreaks(name=name, is_home=is_home)
     
-    # Scoring
-    plain, home_icon, away_icon = st.session_state.get(f"{prefix}_Scoring", (False, False, False))
-    if plain:
-        team.scoring.append(Streak("scoring", ""))
-    if home_icon:
-        team.scoring.append(Streak("scoring", "🏠"))
-    if away_icon:
-        team.scoring.append(Streak("scoring", "✈️"))
-    
-    # BTTS
-    plain, home_icon, away_icon = st.session_state.get(f"{prefix}_BTTS", (False, False, False))
-    if plain:
-        team.btts.append(Streak("btts", ""))
-    if home_icon:
-        team.btts.append(Streak("btts", "🏠"))
-    if away_icon:
-        team.btts.append(Streak("btts", "✈️"))
-    
-    # No BTTS
-    plain, home_icon, away_icon = st.session_state.get(f"{prefix}_No BTTS", (False, False, False))
-    if plain:
-        team.no_btts.append(Streak("no_btts", ""))
-    if home_icon:
-        team.no_btts.append(Streak("no_btts", "🏠"))
-    if away_icon:
-        team.no_btts.append(Streak("no_btts", "✈️"))
-    
-    # Over 0.5
-    plain, home_icon, away_icon = st.session_state.get(f"{prefix}_Over 0.5", (False, False, False))
-    if plain:
-        team.over05.append(Streak("over05", ""))
-    if home_icon:
-        team.over05.append(Streak("over05", "🏠"))
-    if away_icon:
-        team.over05.append(Streak("over05", "✈️"))
-    
-    # Over 2.5
-    plain, home_icon, away_icon = st.session_state.get(f"{prefix}_Over 2.5", (False, False, False))
-    if plain:
-        team.over25.append(Streak("over25", ""))
-    if home_icon:
-        team.over25.append(Streak("over25", "🏠"))
-    if away_icon:
-        team.over25.append(Streak("over25", "✈️"))
-    
-    # Unbeaten
-    plain, home_icon, away_icon = st.session_state.get(f"{prefix}_Unbeaten", (False, False, False))
-    if plain:
-        team.unbeaten.append(Streak("unbeaten", ""))
-    if home_icon:
-        team.unbeaten.append(Streak("unbeaten", "🏠"))
-    if away_icon:
-        team.unbeaten.append(Streak("unbeaten", "✈️"))
-    
-    # Without Win
-    plain, home_icon, away_icon = st.session_state.get(f"{prefix}_Without Win", (False, False, False))
-    if plain:
-        team.without_win.append(Streak("without_win", ""))
-    if home_icon:
-        team.without_win.append(Streak("without_win", "🏠"))
-    if away_icon:
-        team.without_win.append(Streak("without_win", "✈️"))
+    for label, attr, _ in STREAK_CATEGORIES:
+        plain, home_icon, away_icon = st.session_state.get(f"{prefix}_{label}", (False, False, False))
+        streaks = getattr(team, attr)
+        if plain:
+            streaks.append(Streak(attr, ""))
+        if home_icon:
+            streaks.append(Streak(attr, "🏠"))
+        if away_icon:
+            streaks.append(Streak(attr, "✈️"))
     
     return team
 
@@ -583,33 +556,9 @@ def main():
     # ========================================================================
     st.markdown(f"<div class='team-header-home'><span class='team-name'>🏠 {home_name} (HOME)</span><br><span style='font-size:0.7rem;'>🏠 streaks apply | ✈️ streaks are IGNORED | Plain streaks apply</span></div>", unsafe_allow_html=True)
     
-    with st.expander("📊 Scoring Streaks", expanded=True):
-        data = streak_checkboxes("Scoring", "home")
-        st.session_state["home_Scoring"] = data
-    
-    with st.expander("⚡ BTTS Streaks", expanded=False):
-        data = streak_checkboxes("BTTS", "home")
-        st.session_state["home_BTTS"] = data
-    
-    with st.expander("🚫 No BTTS Streaks", expanded=False):
-        data = streak_checkboxes("No BTTS", "home")
-        st.session_state["home_No BTTS"] = data
-    
-    with st.expander("📈 Over 0.5 Goals Streaks", expanded=False):
-        data = streak_checkboxes("Over 0.5", "home")
-        st.session_state["home_Over 0.5"] = data
-    
-    with st.expander("📈 Over 2.5 Goals Streaks", expanded=False):
-        data = streak_checkboxes("Over 2.5", "home")
-        st.session_state["home_Over 2.5"] = data
-    
-    with st.expander("🛡️ Unbeaten Streaks", expanded=False):
-        data = streak_checkboxes("Unbeaten", "home")
-        st.session_state["home_Unbeaten"] = data
-    
-    with st.expander("📉 Without Win Streaks", expanded=False):
-        data = streak_checkboxes("Without Win", "home")
-        st.session_state["home_Without Win"] = data
+    for label, _, title in STREAK_CATEGORIES:
+        with st.expander(title, expanded=(label == "Scoring")):
+            st.session_state[f"home_{label}"] = streak_checkboxes(label, "home")
     
     st.divider()
     
@@ -618,33 +567,9 @@ def main():
     # ========================================================================
     st.markdown(f"<div class='team-header-away'><span class='team-name'>✈️ {away_name} (AWAY)</span><br><span style='font-size:0.7rem;'>✈️ streaks apply | 🏠 streaks are IGNORED | Plain streaks apply</span></div>", unsafe_allow_html=True)
     
-    with st.expander("📊 Scoring Streaks", expanded=True):
-        data = streak_checkboxes("Scoring", "away")
-        st.session_state["away_Scoring"] = data
-    
-    with st.expander("⚡ BTTS Streaks", expanded=False):
-        data = streak_checkboxes("BTTS", "away")
-        st.session_state["away_BTTS"] = data
-    
-    with st.expander("🚫 No BTTS Streaks", expanded=False):
-        data = streak_checkboxes("No BTTS", "away")
-        st.session_state["away_No BTTS"] = data
-    
-    with st.expander("📈 Over 0.5 Goals Streaks", expanded=False):
-        data = streak_checkboxes("Over 0.5", "away")
-        st.session_state["away_Over 0.5"] = data
-    
-    with st.expander("📈 Over 2.5 Goals Streaks", expanded=False):
-        data = streak_checkboxes("Over 2.5", "away")
-        st.session_state["away_Over 2.5"] = data
-    
-    with st.expander("🛡️ Unbeaten Streaks", expanded=False):
-        data = streak_checkboxes("Unbeaten", "away")
-        st.session_state["away_Unbeaten"] = data
-    
-    with st.expander("📉 Without Win Streaks", expanded=False):
-        data = streak_checkboxes("Without Win", "away")
-        st.session_state["away_Without Win"] = data
+    for label, _, title in STREAK_CATEGORIES:
+        with st.expander(title, expanded=(label == "Scoring")):
+            st.session_state[f"away_{label}"] = streak_checkboxes(label, "away")
     
     st.divider()
     